@@ -0,0 +1,247 @@
+import asyncio
+import os
+import threading
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError, CollectionInvalid
+from pymongo.write_concern import WriteConcern
+from daos.mongodb_client import (
+    MongoDBClient, SOFT_DELETE_UPDATE, apply_cursor_options, attach_inserted_ids, check_update_document,
+    client_options, iter_chunks, live_filter, validate_all
+)
+from utils.logger import Logger
+from utils.env_loader import load_platform_specific_env
+
+logger = Logger(__name__)
+# Dynamically load environment variables based on OS and hostname
+load_platform_specific_env()
+
+# Shared AsyncIOMotorClient per (URI, event loop). A motor client is bound to the loop that first
+# uses it, so each loop (every asyncio.run call, worker or test) gets its own client.
+_ASYNC_CLIENTS = {}
+_ASYNC_CLIENTS_LOCK = threading.Lock()
+
+
+def _get_shared_async_client(uri):
+    """
+    Return the AsyncIOMotorClient for the URI on the running event loop, creating it on first use.
+    Clients left behind by closed loops are closed and dropped.
+    """
+    loop = asyncio.get_running_loop()
+    key = (uri, loop)
+    client = _ASYNC_CLIENTS.get(key)
+    if client is None:
+        with _ASYNC_CLIENTS_LOCK:
+            client = _ASYNC_CLIENTS.get(key)
+            if client is None:
+                for stale_key in [k for k in _ASYNC_CLIENTS if k[1].is_closed()]:
+                    _ASYNC_CLIENTS.pop(stale_key).close()
+                client = AsyncIOMotorClient(uri, **client_options())
+                _ASYNC_CLIENTS[key] = client
+    return client
+
+
+class AsyncMongoDBClient:
+    """
+    asyncio counterpart of MongoDBClient built on motor, for use from async FastAPI routes.
+    Schemas, compiled validators and soft-delete semantics are shared with MongoDBClient.
+    """
+    _ENSURED = set()
+
+    def __init__(self, db_name=None):
+        self.db_name = db_name if db_name else os.getenv('MONGO_DATABASE', 'fitness_db')
+        self.uri = os.getenv('MONGO_URI')
+
+        if not self.uri:
+            raise ValueError("MONGO_URI environment variable is not set!")
+
+        self.schemas = dict(MongoDBClient.load_schema_cache())
+
+    @property
+    def client(self):
+        """The shared motor client for the running event loop."""
+        return _get_shared_async_client(self.uri)
+
+    @property
+    def db(self):
+        return self.client[self.db_name]
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    def _load_validation_schema(self, schema_filename):
+        """
+        Get a preloaded JSON Schema.
+        :param schema_filename: Name of the schema file
+        :return: Parsed JSON Schema
+        """
+        schema = self.schemas.get(schema_filename)
+        if schema is None:
+            logger.error("Schema file not found: %s", schema_filename)
+            raise FileNotFoundError(f"Schema file not found: {schema_filename}")
+        return schema
+
+    def validate_data(self, data, schema):
+        """
+        Validate data against JSON Schema.
+        :param data: Data to be validated
+        :param schema: JSON Schema for validation
+        """
+        validate_all(schema, (data,))
+
+    async def ensure_validation(self, collection_name, schema_filename):
+        """
+        Ensure the collection exists and load JSON Schema for application-level validation.
+        :param collection_name: Name of the collection
+        :param schema_filename: JSON Schema file name
+        """
+        key = (self.db_name, collection_name, schema_filename)
+        if key in AsyncMongoDBClient._ENSURED:
+            return self._load_validation_schema(schema_filename)
+
+        try:
+            await self.db.create_collection(collection_name)
+            logger.info("Collection '%s' created.", collection_name)
+        except CollectionInvalid:
+            logger.info("Collection '%s' already exists.", collection_name)
+
+        # Only serves {"is_deleted": True} lookups; see MongoDBClient.ensure_validation
+        await self.db[collection_name].create_index(
+            "is_deleted", partialFilterExpression={"is_deleted": True}, name="is_deleted_partial"
+        )
+
+        schema = self._load_validation_schema(schema_filename)
+        logger.warning("Schema validation is not supported in the database. "
+                       "Validation will be performed at the application level for collection: %s", collection_name)
+
+        AsyncMongoDBClient._ENSURED.add(key)
+        return schema
+
+    async def insert_one(self, collection_name, data, schema=None):
+        """
+        Insert a single document into a collection with optional schema validation.
+        """
+        if schema:
+            self.validate_data(data, schema)
+
+        logger.info("Inserting one document into collection: %s", collection_name)
+        result = await self.db[collection_name].insert_one(data)
+        logger.info("Document inserted with ID: %s", result.inserted_id)
+        return result.inserted_id
+
+    async def insert_many(self, collection_name, data_list, schema=None, fast_insert=False, batchsize=None):
+        """
+        Insert multiple documents into the specified collection, optionally validating against a JSON Schema.
+        :param collection_name: Target collection name
+        :param data_list: List of documents to insert
+        :param schema: JSON Schema for validation
+        :param fast_insert: If True, write with w=0 (unacknowledged); write errors are not reported
+        :param batchsize: If set, send data_list in chunks of this many documents to bound memory and
+                          per-call latency; pymongo already splits each call to fit server size limits
+        :return: List of inserted document IDs
+        :raises BulkWriteError: If a chunk has write errors; later chunks are not sent and the IDs inserted
+                                so far are available as error.inserted_ids
+        """
+        logger.info("Inserting many documents into collection: %s", collection_name)
+        if schema:
+            validate_all(schema, data_list)
+
+        if fast_insert:
+            collection = self.db.get_collection(collection_name, write_concern=WriteConcern(w=0))
+        else:
+            collection = self.db[collection_name]
+
+        inserted_ids = []
+        for chunk in iter_chunks(data_list, batchsize):
+            try:
+                result = await collection.insert_many(chunk, ordered=False)
+            except BulkWriteError as e:
+                attach_inserted_ids(e, inserted_ids, chunk)
+                logger.error("Insert many failed after inserting %s document(s)", len(e.inserted_ids))
+                raise
+            inserted_ids.extend(result.inserted_ids)
+        logger.info("Documents inserted with IDs: %s", inserted_ids)
+        return inserted_ids
+
+    async def update_one(self, collection_name, query, update):
+        """
+        Update a single document in a collection.
+        """
+        check_update_document(update)
+
+        logger.debug("Updating %s with query: %s, update: %s", collection_name, query, update)
+        return await self.db[collection_name].update_one(query, update)
+
+    async def find_one(self, collection_name, query, include_deleted=False, projection=None):
+        """
+        Find a single document, ignoring soft-deleted documents by default.
+        """
+        logger.info("Finding one document in collection: %s with query: %s", collection_name, query)
+        return await self.db[collection_name].find_one(live_filter(query, include_deleted), projection=projection)
+
+    async def find_many(self, collection_name, query, include_deleted=False, sort=None, limit=0, skip=0,
+                        projection=None, batch_size=None, as_cursor=False):
+        """
+        Find multiple documents, supporting sorting, limit, and skip options.
+        :param as_cursor: If True, return the motor cursor for `async for` iteration instead of a list
+        """
+        logger.info("Finding many documents in collection: %s with query: %s", collection_name, query)
+        cursor = self.db[collection_name].find(live_filter(query, include_deleted), projection=projection)
+        cursor = apply_cursor_options(cursor, sort=sort, limit=limit, skip=skip, batch_size=batch_size)
+
+        if as_cursor:
+            return cursor
+
+        result_list = await cursor.to_list(length=None)
+        logger.info("Find many result: %s document(s) found", len(result_list))
+        return result_list
+
+    async def count_documents(self, collection_name, query):
+        """
+        Count the number of documents that match the query.
+        """
+        logger.info("Counting documents in collection: %s with query: %s", collection_name, query)
+        return await self.db[collection_name].count_documents(query)
+
+    async def delete_one(self, collection_name, query, soft_delete=True):
+        """
+        Delete a single document, performing a soft delete by default.
+        """
+        logger.info("Deleting one document in collection: %s with query: %s", collection_name, query)
+        collection = self.db[collection_name]
+        if soft_delete:
+            return await collection.update_one(query, SOFT_DELETE_UPDATE)
+        return await collection.delete_one(query)
+
+    async def delete_many(self, collection_name, query, soft_delete=True):
+        """
+        Delete multiple documents, performing a soft delete by default.
+        """
+        logger.info("Deleting many documents in collection: %s with query: %s", collection_name, query)
+        collection = self.db[collection_name]
+        if soft_delete:
+            return await collection.update_many(query, SOFT_DELETE_UPDATE)
+        return await collection.delete_many(query)
+
+    async def bulk_write(self, collection_name, operations, ordered=False):
+        """
+        Submit a batch of write operations in a single round trip.
+        Returns None when operations is empty, since pymongo refuses an empty bulk write.
+        """
+        if not operations:
+            return None
+
+        logger.info("Bulk writing %s operation(s) to collection: %s", len(operations), collection_name)
+        return await self.db[collection_name].bulk_write(operations, ordered=ordered)
+
+    async def soft_delete_many_by_ids(self, collection_name, ids):
+        """
+        Soft delete documents by their IDs using a single bulk write. Returns None when ids is empty.
+        """
+        operations = [UpdateOne({"_id": _id}, SOFT_DELETE_UPDATE) for _id in ids]
+        if not operations:
+            return None
+        return await self.bulk_write(collection_name, operations)
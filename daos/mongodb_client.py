@@ -1,9 +1,18 @@
 import json
+import logging
 import os
+import threading
 from pathlib import Path
-from pymongo import MongoClient
-from pymongo.errors import ConnectionFailure, CollectionInvalid
-from jsonschema import validate, ValidationError
+import fastjsonschema
+try:
+    import orjson as _json_fast
+except ImportError:
+    _json_fast = None
+from pymongo import MongoClient, UpdateOne
+from pymongo.write_concern import WriteConcern
+from pymongo.errors import BulkWriteError, ConnectionFailure, CollectionInvalid
+from jsonschema import ValidationError
+from jsonschema.validators import validator_for
 from utils.logger import Logger
 from utils.env_loader import load_platform_specific_env
 
@@ -11,32 +20,252 @@ logger = Logger(__name__)
 # Dynamically load environment variables based on OS and hostname
 load_platform_specific_env()
 
+# Shared MongoClient per URI. A MongoClient owns a connection pool and topology monitoring,
+# so every MongoDBClient instance in the process reuses the same one.
+_CLIENTS = {}
+_CLIENTS_LOCK = threading.Lock()
+
+# Schema file name -> Path, indexed with a single directory walk at import time
+_SCHEMA_DIR = Path(__file__).parent.parent / "schema"
+_SCHEMA_INDEX = {p.name: p for p in _SCHEMA_DIR.rglob("*.json")}
+
+# Update document for soft deletes, shared by every call instead of rebuilt each time. Never mutate it.
+SOFT_DELETE_UPDATE = {"$set": {"is_deleted": True}}
+
+# Process-wide compiled validators keyed by the schema's sorted JSON serialization, so every
+# MongoDBClient/AsyncMongoDBClient instance and every copy of a schema shares one validator.
+_VALIDATOR_CACHE_BY_CONTENT = {}
+# Fast path keyed by id(schema) that skips serializing already-seen schema objects. Each entry keeps
+# a reference to its schema, so the id cannot be recycled while the entry is alive. The cache is
+# bounded because callers that rebuild schema dicts per request would otherwise pin them forever.
+_VALIDATOR_CACHE = {}
+_VALIDATOR_CACHE_MAX_SIZE = 256
+# Drafts fastjsonschema implements. Schemas without one of these as $schema default to the latest
+# draft in jsonschema, so they go through jsonschema to keep validation identical.
+_FASTJSONSCHEMA_DRAFTS = {
+    f"{scheme}://json-schema.org/draft-{version}/schema"
+    for scheme in ("http", "https")
+    for version in ("04", "06", "07")
+}
+
+
+def check_update_document(update):
+    """
+    Reject update documents the update_one wrappers must not send.
+    :param update: Update document, e.g. {"$set": {...}}
+    :raises ValueError: If update is not a dict or $set contains $-prefixed field names
+    """
+    if not isinstance(update, dict):
+        raise ValueError("Update data must be a dictionary.")
+
+    # 检查更新文档中是否已经包含 `$set`
+    if "$set" in update and isinstance(update["$set"], dict):
+        # 可能是重复封装，直接返回错误
+        for key in update["$set"]:
+            if key.startswith("$"):
+                raise ValueError(f"Illegal field name in update_data: {key}")
+
+
+def client_options():
+    """
+    Keyword options shared by the sync MongoClient and the async motor client.
+    A larger pool plus unordered insert_many/bulk_write is the recommended setup for
+    high-throughput writes; compression cuts wire bytes on large batches.
+    """
+    return {
+        "tlsAllowInvalidCertificates": True,
+        "maxPoolSize": int(os.getenv('MONGO_MAX_POOL_SIZE', 200)),
+        "compressors": os.getenv('MONGO_COMPRESSORS', 'zstd,zlib'),
+        "retryWrites": True,
+        "appname": os.getenv('MONGO_APP_NAME', 'personafit'),
+    }
+
+
+def _get_shared_client(uri):
+    """Return the process-wide MongoClient for the URI, creating it on first use."""
+    client = _CLIENTS.get(uri)
+    if client is None:
+        with _CLIENTS_LOCK:
+            client = _CLIENTS.get(uri)
+            if client is None:
+                client = MongoClient(uri, **client_options())
+                _CLIENTS[uri] = client
+    return client
+
+
+def _json_loads(raw):
+    """Parse JSON bytes, using orjson's native parser when it is installed."""
+    if _json_fast is not None:
+        return _json_fast.loads(raw)
+    return json.loads(raw)
+
+
+def _schema_content_key(schema):
+    """Return a hashable key for the schema's content, independent of key order."""
+    if _json_fast is not None:
+        return _json_fast.dumps(schema, option=_json_fast.OPT_SORT_KEYS)
+    return json.dumps(schema, sort_keys=True)
+
+
+def _read_schema_file(schema_path):
+    """Read and parse a single JSON Schema file."""
+    try:
+        with open(schema_path, "rb") as f:
+            return _json_loads(f.read())
+    except Exception as e:
+        logger.error("Error loading schema file %s: %s", schema_path, e)
+        raise
+
+
+def _compile_validator(schema):
+    """
+    Compile a schema into a validation callable.
+    Draft-04/06/07 schemas are compiled by fastjsonschema, which generates plain Python code for them.
+    Everything else, including schemas fastjsonschema cannot compile, uses the jsonschema validator
+    class for the schema's draft (the latest draft when $schema is absent), as jsonschema.validate does.
+    Defaults are not written into the data and `format` stays an annotation, as with jsonschema.validate.
+    """
+    draft = schema.get("$schema", "").rstrip("#") if isinstance(schema, dict) else ""
+    if draft in _FASTJSONSCHEMA_DRAFTS:
+        try:
+            return fastjsonschema.compile(schema, use_default=False, use_formats=False)
+        except fastjsonschema.JsonSchemaDefinitionException as e:
+            logger.warning("fastjsonschema cannot compile schema, falling back to jsonschema: %s", e)
+
+    validator_cls = validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema).validate
+
+
+def _get_validator(schema):
+    """
+    Return a cached validation callable for the given schema, compiling it on first use.
+    The callable raises JsonSchemaValueException (or jsonschema's ValidationError) on invalid data.
+    :param schema: JSON Schema dict
+    :return: Callable taking the data to validate
+    """
+    entry = _VALIDATOR_CACHE.get(id(schema))
+    if entry is not None and entry[0] is schema:
+        return entry[1]
+
+    content_key = _schema_content_key(schema)
+    validator = _VALIDATOR_CACHE_BY_CONTENT.get(content_key)
+    if validator is None:
+        # setdefault keeps a single shared validator if two threads compile the same schema at once
+        validator = _VALIDATOR_CACHE_BY_CONTENT.setdefault(content_key, _compile_validator(schema))
+
+    if len(_VALIDATOR_CACHE) >= _VALIDATOR_CACHE_MAX_SIZE:
+        _VALIDATOR_CACHE.clear()
+    _VALIDATOR_CACHE[id(schema)] = (schema, validator)
+    return validator
+
+
+def validate_all(schema, data_list):
+    """
+    Validate every document against a JSON Schema, resolving the compiled validator once.
+    :param schema: JSON Schema for validation
+    :param data_list: Iterable of documents to validate
+    :raises ValueError: On the first document that does not match the schema
+    """
+    validator = _get_validator(schema)
+    try:
+        for data in data_list:
+            validator(data)
+    except (fastjsonschema.JsonSchemaValueException, ValidationError) as e:
+        logger.error("Data validation failed: %s", e.message)
+        raise ValueError(f"Data validation error: {e.message}")
+
+
+def live_filter(query, include_deleted=False):
+    """
+    Build the read filter that excludes soft-deleted documents unless explicitly allowed.
+    A new dict is returned so the caller's query is left untouched, and an explicit is_deleted in the
+    query takes precedence. Live documents carry no is_deleted field, only soft-deleted ones have is_deleted: True.
+    :param query: Query to filter documents
+    :param include_deleted: If True, return the query unchanged
+    """
+    return query if include_deleted else {"is_deleted": {"$ne": True}, **query}
+
+
+def apply_cursor_options(cursor, sort=None, limit=0, skip=0, batch_size=None):
+    """
+    Apply find_many's sort/skip/limit/batch_size options to a pymongo or motor cursor.
+    :return: The configured cursor
+    """
+    if sort:
+        cursor = cursor.sort(sort)
+    if skip > 0:
+        cursor = cursor.skip(skip)
+    if limit > 0:
+        cursor = cursor.limit(limit)
+    if batch_size:
+        cursor = cursor.batch_size(batch_size)
+    return cursor
+
+
+def iter_chunks(data_list, batchsize=None):
+    """
+    Split data_list into insert_many chunks of batchsize documents, or a single chunk when batchsize is unset.
+    An empty data_list yields nothing.
+    """
+    step = batchsize if batchsize and batchsize > 0 else max(len(data_list), 1)
+    for start in range(0, len(data_list), step):
+        yield data_list[start:start + step]
+
+
+def attach_inserted_ids(error, inserted_ids, chunk):
+    """
+    Record on a BulkWriteError the IDs that were inserted before and alongside the failure.
+    Sets error.inserted_ids to inserted_ids from earlier chunks plus the documents of the failed
+    unordered chunk that had no write error (pymongo assigns _id to each document before sending).
+    :param error: BulkWriteError raised for chunk
+    :param inserted_ids: IDs inserted by the chunks that completed before chunk
+    :param chunk: Documents of the chunk that raised
+    """
+    failed = {write_error["index"] for write_error in error.details.get("writeErrors", [])}
+    error.inserted_ids = inserted_ids + [
+        data["_id"] for index, data in enumerate(chunk) if index not in failed and "_id" in data
+    ]
+
 
 class MongoDBClient:
-    def __init__(self, db_name=None):
+    # Schema file name -> parsed schema, loaded once per process and shared by all instances
+    _SCHEMA_CACHE = {}
+    # (db_name, collection_name, schema_filename) combinations already set up by ensure_validation
+    _ENSURED = set()
+
+    def __init__(self, db_name=None, verify=False):
+        """
+        :param db_name: Database name, defaults to the MONGO_DATABASE environment variable
+        :param verify: If True, ping the server on connect. Otherwise pymongo connects lazily and
+                       reports an unreachable server on the first operation (serverSelectionTimeoutMS).
+        """
+        self.verify = verify
         self.db_name = db_name if db_name else os.getenv('MONGO_DATABASE', 'fitness_db')
         self.uri = os.getenv('MONGO_URI')
 
         if not self.uri:
             raise ValueError("MONGO_URI environment variable is not set!")
 
-        logger.info(f"MongoDB URI constructed: {self.uri}")
+        logger.info("MongoDB URI constructed: %s", self.uri)
         self.client = None
         self.db = None
         self.schemas = {}  # Cache loaded schemas
+        self._preload_schemas()
         self._connect()
 
     def _connect(self):
-        """Connect to MongoDB and test connection"""
+        """Connect to MongoDB, testing the connection only when verify is enabled"""
         if not self.client:
             try:
-                logger.info(f"Connecting to MongoDB: URI={self.uri}, DB_NAME={self.db_name}")
-                self.client = MongoClient(self.uri, tlsAllowInvalidCertificates=True)
+                logger.info("Connecting to MongoDB: URI=%s, DB_NAME=%s", self.uri, self.db_name)
+                self.client = _get_shared_client(self.uri)
                 self.db = self.client[self.db_name]
-                self.client.admin.command('ping')  # 测试连接
-                logger.info(f"Successfully connected to MongoDB database: {self.db_name}")
+                if self.verify:
+                    self.client.admin.command('ping')  # 测试连接
+                    logger.info("Successfully connected to MongoDB database: %s", self.db_name)
             except Exception as e:
-                logger.error(f"Failed to connect to MongoDB: {str(e)}")
+                logger.error("Failed to connect to MongoDB: %s", e)
                 self.db = None
                 raise
 
@@ -49,36 +278,49 @@ class MongoDBClient:
         self.close()
 
     def close(self):
-        """Close the MongoDB connection"""
+        """
+        Release this instance's handle on the MongoDB connection.
+        The underlying MongoClient is shared by the whole process and stays open for other instances.
+        """
         if self.client:
-            self.client.close()
-            logger.info("MongoDB connection closed.")
+            logger.debug("MongoDB connection released.")
             self.client = None
             self.db = None
 
+    @classmethod
+    def load_schema_cache(cls):
+        """
+        Load every JSON Schema under the schema directory into the class-level cache.
+        Files are parsed only once per process; later calls reuse the result.
+        :return: Dict of schema file name to parsed schema
+        """
+        if not cls._SCHEMA_CACHE:
+            logger.debug("Preloading schemas from: %s", _SCHEMA_DIR)
+            for schema_name, schema_path in _SCHEMA_INDEX.items():
+                cls._SCHEMA_CACHE[schema_name] = _read_schema_file(schema_path)
+        return cls._SCHEMA_CACHE
+
+    def _preload_schemas(self):
+        """Load every JSON Schema under the schema directory into self.schemas."""
+        self.schemas.update(self.load_schema_cache())
+
     def _load_validation_schema(self, schema_filename):
         """
-        Load JSON Schema from the schema directory or its subdirectories.
+        Get a JSON Schema from the schema directory or its subdirectories.
         :param schema_filename: Name of the schema file
         :return: Parsed JSON Schema
         """
-        base_path = Path(__file__).parent.parent / "schema"
-
-        logger.debug(f"Base path for schemas: {base_path.resolve()}")
-        try:
-            # Search for the schema file in all subdirectories
-            schema_path = next(base_path.rglob(schema_filename))
-            logger.debug(f"Found schema file at: {schema_path}")
-            with open(schema_path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except StopIteration:
-            logger.error(f"Schema file not found: {schema_filename} in {base_path.resolve()} or its subdirectories.")
-            raise FileNotFoundError(
-                f"Schema file not found: {schema_filename} in {base_path.resolve()} or its subdirectories."
-            )
-        except Exception as e:
-            logger.error(f"Error loading schema file {schema_filename}: {str(e)}")
-            raise
+        schema = self.schemas.get(schema_filename)
+        if schema is None:
+            schema_path = _SCHEMA_INDEX.get(schema_filename)
+            if schema_path is None:
+                logger.error("Schema file not found: %s in %s or its subdirectories.", schema_filename, _SCHEMA_DIR)
+                raise FileNotFoundError(
+                    f"Schema file not found: {schema_filename} in {_SCHEMA_DIR.resolve()} or its subdirectories."
+                )
+            schema = _read_schema_file(schema_path)
+            self.schemas[schema_filename] = schema
+        return schema
 
     def validate_data(self, data, schema):
         """
@@ -86,11 +328,7 @@ class MongoDBClient:
         :param data: Data to be validated
         :param schema: JSON Schema for validation
         """
-        try:
-            validate(instance=data, schema=schema)
-        except ValidationError as e:
-            logger.error(f"Data validation failed: {e.message}")
-            raise ValueError(f"Data validation error: {e.message}")
+        validate_all(schema, (data,))
 
     def ensure_validation(self, collection_name, schema_filename):
         """
@@ -98,16 +336,28 @@ class MongoDBClient:
         :param collection_name: Name of the collection
         :param schema_filename: JSON Schema file name
         """
+        key = (self.db_name, collection_name, schema_filename)
+        if key in MongoDBClient._ENSURED:
+            return self._load_validation_schema(schema_filename)
+
         try:
             self.db.create_collection(collection_name)
-            logger.info(f"Collection '{collection_name}' created.")
+            logger.info("Collection '%s' created.", collection_name)
         except CollectionInvalid:
-            logger.info(f"Collection '{collection_name}' already exists.")
+            logger.info("Collection '%s' already exists.", collection_name)
+
+        # Partial index over soft-deleted documents only. It serves "list deleted" lookups, i.e. queries that
+        # filter on {"is_deleted": True} (find_* with include_deleted=True). The default live-document reads use
+        # {"is_deleted": {"$ne": True}}, which does not imply the partial filter, so they never use this index.
+        self.db[collection_name].create_index(
+            "is_deleted", partialFilterExpression={"is_deleted": True}, name="is_deleted_partial"
+        )
 
         schema = self._load_validation_schema(schema_filename)
-        logger.warning(f"Schema validation is not supported in the database. "
-                       f"Validation will be performed at the application level for collection: {collection_name}")
+        logger.warning("Schema validation is not supported in the database. "
+                       "Validation will be performed at the application level for collection: %s", collection_name)
 
+        MongoDBClient._ENSURED.add(key)
         return schema
 
     def insert_one(self, collection_name, data, schema=None):
@@ -120,28 +370,19 @@ class MongoDBClient:
         if schema:
             self.validate_data(data, schema)
 
-        logger.info(f"Inserting one document into collection: {collection_name}")
-        data["is_deleted"] = False
+        logger.info("Inserting one document into collection: %s", collection_name)
         collection = self.db[collection_name]
         result = collection.insert_one(data)
-        logger.info(f"Document inserted with ID: {result.inserted_id}")
+        logger.info("Document inserted with ID: %s", result.inserted_id)
         return result.inserted_id
 
     def update_one(self, collection_name, query, update):
         """
         Update a single document in a collection.
         """
-        if not isinstance(update, dict):
-            raise ValueError("Update data must be a dictionary.")
+        check_update_document(update)
 
-        # 检查更新文档中是否已经包含 `$set`
-        if "$set" in update and isinstance(update["$set"], dict):
-            # 可能是重复封装，直接返回错误
-            for key in update["$set"]:
-                if key.startswith("$"):
-                    raise ValueError(f"Illegal field name in update_data: {key}")
-
-        logger.debug(f"Updating {collection_name} with query: {query}, update: {update}")
+        logger.debug("Updating %s with query: %s, update: %s", collection_name, query, update)
         collection = self.db[collection_name]
         return collection.update_one(query, update)
 
@@ -159,37 +400,16 @@ class MongoDBClient:
         Returns:
             dict: The found document, or None if no document matches the query.
         """
-        logger.info(f"Finding one document in collection: {collection_name} with query: {query}")
-
-        # Exclude soft-deleted documents unless explicitly allowed
-        if not include_deleted:
-            query["is_deleted"] = False
+        logger.info("Finding one document in collection: %s with query: %s", collection_name, query)
 
-        # Execute the query with the optional projection
+        # Execute the query with the optional projection, excluding soft-deleted documents unless allowed
         collection = self.db[collection_name]
-        result = collection.find_one(query, projection=projection)
-        logger.info(f"Find one result: {result}")
+        result = collection.find_one(live_filter(query, include_deleted), projection=projection)
+        # Stringifying a whole document is expensive, so only do it when debug logging is on
+        if logger.is_enabled_for(logging.DEBUG):
+            logger.debug("Find one result: %s", result)
         return result
 
-    def insert_many(self, collection_name, data_list, schema=None):
-        """
-        Insert multiple documents into a collection with optional schema validation.
-        :param collection_name: Target collection name
-        :param data_list: List of document data to insert
-        :param schema: JSON Schema for validation
-        """
-        if schema:
-            for data in data_list:
-                self.validate_data(data, schema)
-
-        logger.info(f"Inserting many documents into collection: {collection_name}")
-        for data in data_list:
-            data["is_deleted"] = False
-        collection = self.db[collection_name]
-        result = collection.insert_many(data_list)
-        logger.info(f"Documents inserted with IDs: {result.inserted_ids}")
-        return result.inserted_ids
-
     def delete_one(self, collection_name, query, soft_delete=True):
         """
         Delete a single document, performing a soft delete by default.
@@ -197,19 +417,19 @@ class MongoDBClient:
         :param query: Query to identify the document
         :param soft_delete: If True, perform a soft delete by setting is_deleted to True
         """
-        logger.info(f"Deleting one document in collection: {collection_name} with query: {query}")
+        logger.info("Deleting one document in collection: %s with query: %s", collection_name, query)
         collection = self.db[collection_name]
 
         if soft_delete:
-            update_data = {"is_deleted": True}
-            result = collection.update_one(query, {"$set": update_data})
-            logger.info(f"Soft delete result: {result.modified_count} document(s) modified")
+            result = collection.update_one(query, SOFT_DELETE_UPDATE)
+            logger.info("Soft delete result: %s document(s) modified", result.modified_count)
         else:
             result = collection.delete_one(query)
-            logger.info(f"Physical delete result: {result.deleted_count} document(s) deleted")
+            logger.info("Physical delete result: %s document(s) deleted", result.deleted_count)
         return result
 
-    def find_many(self, collection_name, query, include_deleted=False, sort=None, limit=0, skip=0):
+    def find_many(self, collection_name, query, include_deleted=False, sort=None, limit=0, skip=0,
+                  projection=None, batch_size=None, as_cursor=False):
         """
         Find multiple documents, supporting sorting, limit, and skip options.
         :param collection_name: Target collection name
@@ -218,42 +438,61 @@ class MongoDBClient:
         :param sort: Sorting criteria (e.g., [("field", pymongo.ASCENDING)])
         :param limit: Number of documents to return
         :param skip: Number of documents to skip
+        :param projection: A projection dict to include or exclude specific fields, e.g. {"name": 1}
+        :param batch_size: Number of documents the server returns per batch
+        :param as_cursor: If True, return the pymongo cursor instead of a list. Documents are then fetched
+                          and decoded batch by batch as the caller iterates, rather than all up front.
+        :return: List of documents, or the cursor when as_cursor is True
         """
-        logger.info(f"Finding many documents in collection: {collection_name} with query: {query}")
-        if not include_deleted:
-            query["is_deleted"] = False
+        logger.info("Finding many documents in collection: %s with query: %s", collection_name, query)
         collection = self.db[collection_name]
 
-        cursor = collection.find(query)
-        if sort:
-            cursor = cursor.sort(sort)
-        if skip > 0:
-            cursor = cursor.skip(skip)
-        if limit > 0:
-            cursor = cursor.limit(limit)
+        cursor = collection.find(live_filter(query, include_deleted), projection=projection)
+        cursor = apply_cursor_options(cursor, sort=sort, limit=limit, skip=skip, batch_size=batch_size)
+
+        if as_cursor:
+            return cursor
 
         result_list = list(cursor)
-        logger.info(f"Find many result: {len(result_list)} document(s) found")
+        logger.info("Find many result: %s document(s) found", len(result_list))
         return result_list
 
-    def insert_many(self, collection_name, data_list, schema=None):
+    def insert_many(self, collection_name, data_list, schema=None, fast_insert=False, batchsize=None):
         """
         Insert multiple documents into the specified collection, optionally validating against a JSON Schema.
         :param collection_name: Target collection name
         :param data_list: List of documents to insert
         :param schema: JSON Schema for validation
+        :param fast_insert: If True, write with w=0 (unacknowledged). Much higher throughput, but write
+                            errors such as duplicate keys are not reported back to the caller.
+        :param batchsize: If set, send data_list in chunks of this many documents. pymongo already splits
+                          each insert_many to fit the server's message and batch size limits; this only bounds
+                          how much is held in flight per call (memory and per-call latency).
+        :return: List of inserted document IDs
+        :raises BulkWriteError: If a chunk has write errors. Later chunks are not sent. The IDs inserted
+                                so far, including earlier chunks, are available as error.inserted_ids.
         """
-        logger.info(f"Inserting many documents into collection: {collection_name}")
+        logger.info("Inserting many documents into collection: %s", collection_name)
         if schema:
-            for data in data_list:
-                self.validate_data(data, schema)
+            validate_all(schema, data_list)
 
-        for data in data_list:
-            data["is_deleted"] = False
-        collection = self.db[collection_name]
-        result = collection.insert_many(data_list)
-        logger.info(f"Documents inserted with IDs: {result.inserted_ids}")
-        return result.inserted_ids
+        if fast_insert:
+            collection = self.db.get_collection(collection_name, write_concern=WriteConcern(w=0))
+        else:
+            collection = self.db[collection_name]
+
+        inserted_ids = []
+        for chunk in iter_chunks(data_list, batchsize):
+            # Unordered inserts let the server keep going past individual failures and process the batch in parallel
+            try:
+                result = collection.insert_many(chunk, ordered=False)
+            except BulkWriteError as e:
+                attach_inserted_ids(e, inserted_ids, chunk)
+                logger.error("Insert many failed after inserting %s document(s)", len(e.inserted_ids))
+                raise
+            inserted_ids.extend(result.inserted_ids)
+        logger.info("Documents inserted with IDs: %s", inserted_ids)
+        return inserted_ids
 
     def count_documents(self, collection_name, query):
         """
@@ -262,10 +501,10 @@ class MongoDBClient:
         :param query: Query to filter documents
         :return: Count of matching documents
         """
-        logger.info(f"Counting documents in collection: {collection_name} with query: {query}")
+        logger.info("Counting documents in collection: %s with query: %s", collection_name, query)
         collection = self.db[collection_name]
         count = collection.count_documents(query)
-        logger.info(f"Count result: {count} document(s) found")
+        logger.info("Count result: %s document(s) found", count)
         return count
 
     def delete_many(self, collection_name, query, soft_delete=True):
@@ -275,14 +514,44 @@ class MongoDBClient:
         :param query: Query to identify the documents
         :param soft_delete: If True, perform a soft delete by setting is_deleted to True
         """
-        logger.info(f"Deleting many documents in collection: {collection_name} with query: {query}")
+        logger.info("Deleting many documents in collection: %s with query: %s", collection_name, query)
         collection = self.db[collection_name]
 
         if soft_delete:
-            update_data = {"is_deleted": True}
-            result = collection.update_many(query, {"$set": update_data})
-            logger.info(f"Soft delete result: {result.modified_count} document(s) modified")
+            result = collection.update_many(query, SOFT_DELETE_UPDATE)
+            logger.info("Soft delete result: %s document(s) modified", result.modified_count)
         else:
             result = collection.delete_many(query)
-            logger.info(f"Physical delete result: {result.deleted_count} document(s) deleted")
+            logger.info("Physical delete result: %s document(s) deleted", result.deleted_count)
         return result
+
+    def bulk_write(self, collection_name, operations, ordered=False):
+        """
+        Submit a batch of write operations in a single round trip.
+        :param collection_name: Target collection name
+        :param operations: List of pymongo write models (InsertOne, UpdateOne, DeleteOne, ...)
+        :param ordered: If True, stop at the first failed operation
+        :return: BulkWriteResult, or None when operations is empty (pymongo refuses an empty bulk write)
+        """
+        if not operations:
+            logger.info("No bulk write operations for collection: %s", collection_name)
+            return None
+
+        logger.info("Bulk writing %s operation(s) to collection: %s", len(operations), collection_name)
+        collection = self.db[collection_name]
+        result = collection.bulk_write(operations, ordered=ordered)
+        logger.info("Bulk write result: %s inserted, %s modified, %s deleted",
+                    result.inserted_count, result.modified_count, result.deleted_count)
+        return result
+
+    def soft_delete_many_by_ids(self, collection_name, ids):
+        """
+        Soft delete documents by their IDs using a single bulk write.
+        :param collection_name: Target collection name
+        :param ids: List of document IDs
+        :return: BulkWriteResult, or None when ids is empty
+        """
+        operations = [UpdateOne({"_id": _id}, SOFT_DELETE_UPDATE) for _id in ids]
+        if not operations:
+            return None
+        return self.bulk_write(collection_name, operations)
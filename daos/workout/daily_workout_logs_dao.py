@@ -136,7 +136,7 @@ class DailyWorkoutLogsDAO:
         Calculate overall progress for a user.
         """
         logger.info(f"Calculating total progress for user_id: {user_id}")
-        query = {"user_id": ObjectId(user_id), "is_deleted": False}
+        query = {"user_id": ObjectId(user_id), "is_deleted": {"$ne": True}}
 
         try:
             with self.db_client as db_client:
@@ -180,7 +180,7 @@ class DailyWorkoutLogsDAO:
         Calculate daily workout progress for a user based on all workout logs.
         """
         logger.info(f"Calculating daily workout progress for user_id: {user_id}")
-        query = {"user_id": ObjectId(user_id), "is_deleted": False}
+        query = {"user_id": ObjectId(user_id), "is_deleted": {"$ne": True}}
 
         try:
             with self.db_client as db_client:
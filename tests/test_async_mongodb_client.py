@@ -0,0 +1,114 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError, ServerSelectionTimeoutError
+from pymongo.results import InsertManyResult
+
+from daos.async_mongodb_client import AsyncMongoDBClient
+from daos.mongodb_client import SOFT_DELETE_UPDATE
+
+# Nothing listens on port 1, so every operation fails fast with a server selection timeout
+UNREACHABLE_URI = "mongodb://localhost:1/?serverSelectionTimeoutMS=100"
+
+
+def test_client_works_across_separate_event_loops(monkeypatch):
+    monkeypatch.setenv("MONGO_URI", UNREACHABLE_URI)
+
+    async def find_one():
+        client = AsyncMongoDBClient()
+        with pytest.raises(ServerSelectionTimeoutError):
+            await client.find_one("users", {})
+        return client.client
+
+    first = asyncio.run(find_one())
+    second = asyncio.run(find_one())
+
+    # A client bound to the first, now closed, loop would fail with "Event loop is closed"
+    assert first is not second
+
+
+@pytest.fixture
+def collection(monkeypatch):
+    """A mocked motor collection behind AsyncMongoDBClient.db."""
+    monkeypatch.setenv("MONGO_URI", UNREACHABLE_URI)
+    collection = MagicMock()
+    collection.insert_many = AsyncMock(
+        side_effect=lambda docs, ordered: InsertManyResult([doc["_id"] for doc in docs], True)
+    )
+    collection.bulk_write = AsyncMock(return_value="bulk-result")
+    db = MagicMock()
+    db.__getitem__.return_value = collection
+    db.get_collection.return_value = collection
+    monkeypatch.setattr(AsyncMongoDBClient, "db", property(lambda self: db))
+    return collection
+
+
+def test_insert_many_splits_into_unordered_chunks(collection):
+    docs = [{"_id": i, "name": f"user{i}"} for i in range(5)]
+
+    inserted_ids = asyncio.run(AsyncMongoDBClient().insert_many("users", docs, batchsize=2))
+
+    assert inserted_ids == [0, 1, 2, 3, 4]
+    assert [c.args[0] for c in collection.insert_many.call_args_list] == [docs[0:2], docs[2:4], docs[4:5]]
+    assert all(c.kwargs == {"ordered": False} for c in collection.insert_many.call_args_list)
+    assert all("is_deleted" not in doc for doc in docs)
+
+
+def test_insert_many_attaches_inserted_ids_on_chunk_failure(collection):
+    docs = [{"_id": i} for i in range(4)]
+    collection.insert_many.side_effect = [
+        InsertManyResult([0, 1], True),
+        BulkWriteError({"writeErrors": [{"index": 0}]}),
+    ]
+
+    with pytest.raises(BulkWriteError) as exc_info:
+        asyncio.run(AsyncMongoDBClient().insert_many("users", docs, batchsize=2))
+
+    assert exc_info.value.inserted_ids == [0, 1, 3]
+
+
+def test_insert_many_rejects_invalid_documents(collection):
+    schema = {"$schema": "http://json-schema.org/draft-07/schema#", "required": ["name"]}
+
+    with pytest.raises(ValueError):
+        asyncio.run(AsyncMongoDBClient().insert_many("users", [{"_id": 1}], schema=schema))
+
+    collection.insert_many.assert_not_called()
+
+
+def test_find_many_returns_cursor_or_list(collection):
+    cursor = MagicMock()
+    cursor.sort.return_value = cursor
+    cursor.limit.return_value = cursor
+    cursor.to_list = AsyncMock(return_value=[{"_id": 1}])
+    collection.find.return_value = cursor
+    query = {"username": "adam"}
+
+    result = asyncio.run(AsyncMongoDBClient().find_many("users", query, sort=[("username", 1)], limit=5,
+                                                        as_cursor=True))
+    assert result is cursor
+    collection.find.assert_called_with({"is_deleted": {"$ne": True}, "username": "adam"}, projection=None)
+    cursor.sort.assert_called_with([("username", 1)])
+    cursor.limit.assert_called_with(5)
+    cursor.skip.assert_not_called()
+    cursor.to_list.assert_not_called()
+
+    result = asyncio.run(AsyncMongoDBClient().find_many("users", query))
+    assert result == [{"_id": 1}]
+    assert query == {"username": "adam"}
+
+
+def test_soft_delete_many_by_ids_uses_one_bulk_write(collection):
+    result = asyncio.run(AsyncMongoDBClient().soft_delete_many_by_ids("users", [1, 2]))
+
+    assert result == "bulk-result"
+    operations = collection.bulk_write.call_args.args[0]
+    assert operations == [UpdateOne({"_id": 1}, SOFT_DELETE_UPDATE), UpdateOne({"_id": 2}, SOFT_DELETE_UPDATE)]
+    assert collection.bulk_write.call_args.kwargs == {"ordered": False}
+
+
+def test_soft_delete_many_by_ids_skips_empty_ids(collection):
+    assert asyncio.run(AsyncMongoDBClient().soft_delete_many_by_ids("users", [])) is None
+    collection.bulk_write.assert_not_called()
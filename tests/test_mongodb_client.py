@@ -0,0 +1,32 @@
+import types
+
+import pytest
+
+from daos.mongodb_client import MongoDBClient, _get_validator, validate_all
+
+
+@pytest.mark.parametrize("schema_filename", sorted(MongoDBClient.load_schema_cache()))
+def test_repo_schemas_compile_with_fastjsonschema(schema_filename):
+    validator = _get_validator(MongoDBClient.load_schema_cache()[schema_filename])
+
+    # fastjsonschema returns a generated function; the jsonschema fallback is a bound method
+    assert isinstance(validator, types.FunctionType)
+
+
+def test_schema_without_draft_uses_latest_jsonschema_draft():
+    schema = {"type": "array", "prefixItems": [{"type": "integer"}]}
+
+    with pytest.raises(ValueError):
+        validate_all(schema, [["x"]])
+
+
+def test_validation_does_not_inject_defaults_or_check_formats():
+    schema = {
+        "$schema": "http://json-schema.org/draft-07/schema#",
+        "properties": {"a": {"default": 5}, "email": {"type": "string", "format": "email"}},
+    }
+    data = {"email": "notanemail"}
+
+    validate_all(schema, [data])
+
+    assert data == {"email": "notanemail"}
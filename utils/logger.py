@@ -78,20 +78,23 @@ class Logger:
         audit_file_handler.setFormatter(JsonFormatter(json_format=True))  # 文件使用 JSON 格式
         self.audit_logger.addHandler(audit_file_handler)
 
-    def info(self, message):
-        self.logger.info(message, stacklevel=2)
+    def info(self, message, *args):
+        self.logger.info(message, *args, stacklevel=2)
 
-    def debug(self, message):
-        self.logger.debug(message, stacklevel=2)
+    def debug(self, message, *args):
+        self.logger.debug(message, *args, stacklevel=2)
 
-    def warning(self, message):
-        self.logger.warning(message, stacklevel=2)
+    def warning(self, message, *args):
+        self.logger.warning(message, *args, stacklevel=2)
 
-    def error(self, message):
-        self.logger.error(message, stacklevel=2)
+    def error(self, message, *args):
+        self.logger.error(message, *args, stacklevel=2)
 
-    def critical(self, message):
-        self.logger.critical(message, stacklevel=2)
+    def critical(self, message, *args):
+        self.logger.critical(message, *args, stacklevel=2)
+
+    def is_enabled_for(self, level):
+        return self.logger.isEnabledFor(level)
 
     def set_level(self, level):
         self.logger.setLevel(level)